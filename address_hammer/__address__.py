@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections import defaultdict
 from .__regex__ import normalize_whitespace
 from .__types__ import (
     Union,
@@ -386,27 +387,22 @@ class HashableFactory(NamedTuple):
 
         d: Dict[Seq[str], Dict[str, Set[str]]] = {}
 
-        unit_store: Dict[Tuple[str, str, str, str], Dict[str, List[Address]]] = {}
+        unit_store: Dict[
+            Tuple[str, str, str, str], Dict[str, List[Address]]
+        ] = defaultdict(lambda: defaultdict(list))
         #             dict[hards, dict[unit, addresses]]
         for a in addresses:
             hards = a.hard_components()
-            softs = d.get(hards, new_dict())
+            softs = d.get(hards)
+            if softs is None:
+                softs = d[hards] = new_dict()
             a_dict = a._asdict()
-            # softs["st_NESW"] = set(["E", "W"])
-            # print("SOFTS", softs)
             for k, v in a_dict.items():
-                # print(k in softs, k, a.pretty())
-                if k in softs and v:  # softs[k]:
-
+                if k in softs and v:
                     softs[k].add(v)
-            d[hards] = softs
 
             if a.unit:
-                u_adds: Dict[str, List[Address]] = unit_store.get(hards, {})
-                adds = u_adds.get(a.unit, [])
-                adds.append(a)
-                u_adds[a.unit] = adds
-                unit_store[hards] = u_adds
+                unit_store[hards][a.unit].append(a)
 
         # should go in Address class?
         idx_of: Dict[str, int] = {
@@ -465,15 +461,15 @@ class HashableFactory(NamedTuple):
                     return True
             return False
 
-        fix_by_hand: Dict[Tuple[str, str, str, str], List[Address]] = {}
+        fix_by_hand: Dict[
+            Tuple[str, str, str, str], List[Address]
+        ] = defaultdict(list)
 
         for a in addresses:
             hards = a.hard_components()
             softs = d[hards]
             if is_ambig(softs):  # cannot have mismatching st_suffix,st_NESW or zip_code
-                similar_addresses = fix_by_hand.get(hards, [])
-                similar_addresses.append(a)
-                fix_by_hand[hards] = similar_addresses
+                fix_by_hand[hards].append(a)
 
         def fix(a: Address) -> List[Address]:
             adds = fill_in(a)
@@ -121,7 +121,7 @@ class FixTypos:
         class __Fns_of_FixTypos__(Fns_of_FixTypos):
             @staticmethod
             def should_maybe_fix(s: str) -> bool:
-                s_uppers = re.findall(uppers, s)
+                s_uppers = uppers.findall(s)
                 if len("".join(s_uppers)) < 4:
                     return False
                 if s in bow_of:
@@ -134,13 +134,13 @@ class FixTypos:
                 bow = skipgram_bow(s)
                 # s_vec = swm.word2row(s)
                 s_bow = skipgram_bow(s)
-                s_digits = re.findall(digits, s)
+                s_digits = digits.findall(s)
                 for tri in bow:
                     words.update(words_with.get(tri, []))
                 return map(
                     lambda w: (w, weighted_jaccard(bow_of[w], s_bow)),
                     filter(
-                        lambda w: w != s and s_digits == re.findall(digits, w), words
+                        lambda w: w != s and s_digits == digits.findall(w), words
                     ),
                 )
 
@@ -170,9 +170,6 @@ class Hammer:
 
             for s in join(to_hash_str):
                 m.update(s.encode("utf-8"))
-            # print(len(list(filter(None, addresses))))
-            # print(list(map(Address.Get.pretty, addresses)))
-            # addresses = sorted(filter(None, addresses))
             for a in sorted(addresses):
                 for s in a.hard_components():
                     m.update(s.encode("utf-8"))
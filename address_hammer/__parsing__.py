@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Pattern, NamedTuple, Type, Mapping
+from typing import Pattern, NamedTuple, Type, Mapping, Deque, Iterator
 from .__types__ import *
 from .__zipper__ import GenericInput as In
 from .__zipper__ import EndOfInputError
@@ -7,6 +7,8 @@ from .__regex__ import or_ as regex_or
 from .__regex__ import normalize_whitespace
 from .__data__ import state_city_pairs, default_cities
 from .__address__ import RawAddress
+from collections import defaultdict, deque
+from functools import lru_cache
 import re
 
 
@@ -51,7 +53,7 @@ zip_code_R = re.compile(r"\d{5}(-\d+)?")
 _HOUSE_NUMBER_R = re.compile(r"[\d/]+")
 
 
-def dicts_to_pattern(*ds: Dict[str, List[Union[str, List[str]]]]) -> Pattern[str]:
+def dicts_to_words(*ds: Dict[str, List[Union[str, List[str]]]]) -> Set[str]:
     f: List[str] = []
     for d in ds:
         for k, row in d.items():
@@ -60,10 +62,42 @@ def dicts_to_pattern(*ds: Dict[str, List[Union[str, List[str]]]]) -> Pattern[str
                 if isinstance(cell, str):
                     cell = cell.split()
                 f.extend(cell)
-    return re.compile(regex_or(set(f)))
+    return set(f)
+
+
+def dicts_to_pattern(*ds: Dict[str, List[Union[str, List[str]]]]) -> Pattern[str]:
+    return re.compile(regex_or(dicts_to_words(*ds)))
+
+
+st_suffix_words = dicts_to_words(st_suffix_syns)
+st_suffix_R = re.compile(regex_or(st_suffix_words))
+
+
+def match_literal(words: Iter[str]) -> Fn[[str], Opt[str]]:
+    """
+    Matches a token like re.match(regex_or(words), token).
+    An alphanumeric token has no word boundary inside it, so it matches iff it is one of 'words'.
+    Only tokens with punctuation (like 'ST.') need the regex.
+    """
+    word_set = frozenset(words)
+    pat = re.compile(regex_or(word_set))
 
+    def x(s: str) -> Opt[str]:
+        if s.isalnum():
+            if s in word_set:
+                return s
+            return None
+        m = pat.match(s)
+        if m is not None:
+            return m.group(0)
+        return None
+
+    return x
 
-st_suffix_R = dicts_to_pattern(st_suffix_syns)
+
+is_st_suffix = match_literal(st_suffix_words)
+is_unit_type = match_literal(unit_types_lst)
+is_st_NESW = match_literal(st_NESWs)
 
 
 def try_regex(pat: Pattern[str]) -> Fn[[In[str], Fn[[In[str]], None]], Opt[str]]:
@@ -71,7 +105,7 @@ def try_regex(pat: Pattern[str]) -> Fn[[In[str], Fn[[In[str]], None]], Opt[str]]
         if inpt.empty():
             return None
         item, rest = inpt.view()
-        m = re.match(pat, item)
+        m = pat.match(item)
         if m is not None and m:
             save(rest)
             return m.group(0)
@@ -80,6 +114,23 @@ def try_regex(pat: Pattern[str]) -> Fn[[In[str], Fn[[In[str]], None]], Opt[str]]
     return x
 
 
+def try_literals(
+    match: Fn[[str], Opt[str]]
+) -> Fn[[In[str], Fn[[In[str]], None]], Opt[str]]:
+    "like try_regex, but for a matcher made by match_literal"
+
+    def x(inpt: In[str], save: Fn[[In[str]], None]) -> Opt[str]:
+        if inpt.empty():
+            return None
+        item, rest = inpt.view()
+        m = match(item)
+        if m:
+            save(rest)
+        return m
+
+    return x
+
+
 # TODO don't match bad zips, like 948848-234
 zip_code = try_regex(zip_code_R)
 
@@ -100,13 +151,15 @@ class MxCont(Mx):
 
 
 def make_try_syns(
-    d: Dict[Tuple[Type[Mx], Seq[str]], str],
+    d: Mapping[Tuple[Type[Mx], Seq[str]], str],
     normalizers: List[Fn[[str], Iter[str]]] = [],
 ) -> Fn[[Type[Mx], Seq[str]], Opt[Tuple[Seq[str], str]]]:
     def x(mx: Type[Mx], items: Seq[str]) -> Opt[Tuple[Seq[str], str]]:
         s = d.get((mx, items), None)
         if s is not None:
             return items, s
+        if not normalizers:
+            return None
         focus = items[-1]
         _items = list(items)
         for n in normalizers:
@@ -121,7 +174,7 @@ def make_try_syns(
 
 
 def from_mealy(
-    d: Dict[Tuple[Type[Mx], Seq[str]], str],
+    d: Mapping[Tuple[Type[Mx], Seq[str]], str],
     normalizers: Seq[Opt[Dict[str, List[str]]]] = (),
 ) -> Fn[[In[str], Fn[[In[str]], None]], Opt[str]]:
     """
@@ -129,40 +182,41 @@ def from_mealy(
     the list of values in mealy d is like AND
     """
     # TODO make kwarg 'normalizers' have the type Seq[Union[Fn[[str], Iter[str]], Dict[str, Sequence[str]]]] = []
-    ns: List[Fn[[str], Iter[str]]] = []
+    # every syndict is folded into one table, so each word is a single lookup
+    trans: Dict[str, List[str]] = defaultdict(list)
     for n in normalizers:
         if isinstance(n, dict):
-            trans: Dict[str, List[str]] = {}
-            # n: Dict[str, Iter[str]] = n
             for k, words in n.items():
                 if " " in k:
                     raise Exception(f"'{k}' not allowed bc the syns can't have spaces")
                 for word in words:
-                    trans[word] = trans.get(word, [])
                     trans[word].append(k)
-            ns.append(lambda s: trans.get(s, []))
-        else:
-            pass
+    ns: List[Fn[[str], Iter[str]]] = []
+    if trans:
+        ns.append(lambda s: trans.get(s, ()))
     try_syns = make_try_syns(d, ns)
 
     def run(inpt: In[str], save: Fn[[In[str]], None]) -> Opt[str]:
-        l: List[str] = []
+        # walks the shared token tuple by index; a cursor is only made for the final save
+        data = inpt.data
+        found: Opt[str] = None
+        end = inpt.state
         items: Seq[str] = ()
-        for s, rest in inpt.as_steps():
+        for idx in range(inpt.state, len(data)):
+            s = data[idx]
             end_items_s = try_syns(MxEnd, (*items, s))
             if end_items_s:
-                inpt = rest
-                _, s_end = end_items_s
-                l.append(s_end)
+                end = idx + 1
+                _, found = end_items_s
             cont_items_s = try_syns(MxCont, (*items, s))
             if cont_items_s is None:
                 break
             else:
                 items, _ = cont_items_s
-        if not l:
+        if found is None:
             return None
-        save(inpt)
-        return l[-1]
+        save(In(data, end))
+        return found
 
     return run
 
@@ -204,11 +258,6 @@ def to_normalizer(m: MDict) -> Dict[str, List[str]]:
     return d
 
 
-m = to_mealy(
-    {"South Carolina": [["South", "Carolina"]], "South Dakota": [["South", "Dakota"]]}
-)
-
-
 def syns_to_mealy(
     syns_dict: Dict[str, List[str]]
 ) -> Dict[Tuple[Type[Mx], Seq[str]], str]:
@@ -313,7 +362,6 @@ for line in _s:
     row: List[Seq[str]] = list(set(map(to_seq, l)))
     s[abbr] = row
 
-["#", "APT", "BLDG", "STE", "UNIT", "RM", "DEPT", "TRLR", "LOT", "FL"]
 unit_types: Dict[str, List[str]] = {
     "#": ["#"],
     "APT": ["APARTMENT"],
@@ -339,9 +387,6 @@ unitary_unit_types = {
 }
 
 unit_types.update(unitary_unit_types)
-no_N = re.compile(
-    r"#?\b(\d+|[A-D]|[F-M]|[O-R]|[T-V]|[X-Z])(\d+|[A-D]|[F-M]|[O-R]|[T-V]|[X-Z])?\b"
-)
 no_N = re.compile(r"#?\b(\d+|)?\b")
 # TODO BYPASS
 # TODO KENTUCKY 440
@@ -392,11 +437,13 @@ nesw_m: MDict = {
 reverse_dict(nesw_m)
 
 
+def reversed_input(s: str) -> In[str]:
+    "The words of 's', last word first (addresses are tagged right to left)"
+    return In(tuple(reversed(s.upper().split())))
+
+
 def to_input_lst(s: str) -> List[In[str]]:
-    add = s.upper().split()
-    add.reverse()
-    k = In(add)
-    return [k]
+    return [reversed_input(s)]
 
 
 def make_mod(f: List[In[str]]) -> Fn[[In[str]], None]:
@@ -458,28 +505,25 @@ get_st_suffix = get_with_label(
 
 get_house_number = get_with_label("house_number", try_regex(_HOUSE_NUMBER_R))
 
-get_dangling_unit = try_regex(unit_R)  # "APT" with no identifer
+get_dangling_unit = try_literals(is_unit_type)  # "APT" with no identifer
 get_zip_code = get_with_label("zip_code", zip_code)
 
-is_hwy = dicts_to_pattern(hwys, hwys_syns)
-
 
 def get_unit(inpt: In[str], save: Fn[[In[str]], None]) -> Opt[Tuple[str, str]]:
     single = get_unitary_unit_type(inpt, save)
     if single:
         return ("unit", single)
     x, xs = inpt.item(), inpt.rest()
-    if re.match(st_suffix_R, x):
+    if is_st_suffix(x):
         return None
     if xs.empty():
         return None
     unit = get_unit_type(xs, save)
     if unit:
         return "unit", f"{unit} {x}"
-    if re.match(unit_R, x):
+    if is_unit_type(x):
         # TODO raise Exception("DANGLING UNIT")
         save(xs)
-        pass
     return None
 
 
@@ -515,9 +559,53 @@ def every_other(iter: Iter[T], item: T) -> Iter[T]:
     return join(zip(iter, always_item()))
 
 
-def city_mealy(known_cities: Seq[str] = ()) -> Dict[Tuple[Type[Mx], Seq[str]], str]:
+MealyKey = Tuple[Type[Mx], Seq[str]]
+
+
+class KnownCityMealy(Mapping[MealyKey, str]):
+    """
+    The mealy of the known cities, backed by the shared default mealy instead of a copy of it.
+    Lookups try the defaults first, so the default labels win any overlap.
+    """
+
+    __slots__ = ["known", "defaults", "n_keys"]
+    known: Dict[MealyKey, str]
+    defaults: Dict[MealyKey, str]
+    n_keys: int
+
+    def __init__(self, known: Dict[MealyKey, str], defaults: Dict[MealyKey, str]):
+        self.known = known
+        self.defaults = defaults
+        self.n_keys = len(defaults) + sum(k not in defaults for k in known)
+
+    def get(self, k: MealyKey, v: Any = None) -> Any:
+        # this is the only method the mealy runs call, so it skips the Mapping machinery
+        s = self.defaults.get(k)
+        if s is None:
+            return self.known.get(k, v)
+        return s
+
+    def __getitem__(self, k: MealyKey) -> str:
+        s = self.get(k)
+        if s is None:
+            raise KeyError(k)
+        return s
+
+    def __iter__(self) -> Iterator[MealyKey]:
+        yield from self.defaults
+        for k in self.known:
+            if k not in self.defaults:
+                yield k
+
+    def __len__(self) -> int:
+        return self.n_keys
+
+
+@lru_cache(maxsize=1)
+def default_city_mealy() -> Dict[Tuple[Type[Mx], Seq[str]], str]:
+    "The mealy of every default city, built once (it is the bulk of city_mealy)"
     d: Dict[str, List[Union[str, List[str]]]] = {}
-    for city in [*known_cities, *default_cities]:
+    for city in default_cities:
         d[city] = [city.upper().split()]
     for _, city in state_city_pairs:
         city = city.upper()
@@ -526,15 +614,61 @@ def city_mealy(known_cities: Seq[str] = ()) -> Dict[Tuple[Type[Mx], Seq[str]], s
     return to_mealy(d)
 
 
-get_city = get_with_label(
-    "city",
-    from_mealy(city_mealy(), normalizers=[syns]),
-)
+def city_mealy(
+    known_cities: Seq[str] = (),
+) -> Mapping[Tuple[Type[Mx], Seq[str]], str]:
+    """
+    With no known cities this is the (shared) default mealy.
+    Otherwise only the known cities are converted, and looked up behind the defaults.
+    """
+    if not known_cities:
+        return default_city_mealy()
+    d: Dict[str, List[Union[str, List[str]]]] = {}
+    for city in known_cities:
+        d[city] = [city.upper().split()]
+    reverse_dict(d)
+    return KnownCityMealy(to_mealy(d), default_city_mealy())
+
 
-lonely_unit_id = try_regex(
-    re.compile(r"^#?(\d+|\d+[A-Z]?|[A-Z]\d+|[A-D]|[F-M]|[O-R]|[T-V]|[X-Z])$")
+@lru_cache(maxsize=64)
+def make_get_city(
+    known_cities: Tuple[str, ...] = ()
+) -> Fn[[In[str], Fn[[In[str]], None]], Opt[Tuple[str, str]]]:
+    """
+    Parsers (and smart_batch's second pass) with the same known cities share one city parser.
+    Each entry only holds the mealy of its known cities (the defaults are shared),
+    so 64 entries stay small.
+    """
+    return get_with_label(
+        "city",
+        from_mealy(city_mealy(known_cities=known_cities), normalizers=[syns]),
+    )
+
+
+def get_city(inpt: In[str], save: Fn[[In[str]], None]) -> Opt[Tuple[str, str]]:
+    "Uses the default cities, which are only loaded on first use (not at import)"
+    return make_get_city(())(inpt, save)
+
+
+lonely_unit_id_R = re.compile(
+    r"^#?(\d+|\d+[A-Z]?|[A-Z]\d+|[A-D]|[F-M]|[O-R]|[T-V]|[X-Z])$"
 )
-get_nesw_single = get_with_label("st_NESW", try_regex(st_NESW_R))
+try_lonely_unit_id = try_regex(lonely_unit_id_R)
+
+
+def lonely_unit_id(inpt: In[str], save: Fn[[In[str]], None]) -> Opt[str]:
+    """
+    A lonely unit id has digits or is a single letter,
+    so an alphabetic word of 3+ letters (most street names) is rejected without the regex
+    """
+    if not inpt.empty():
+        item = inpt.item()
+        if len(item) > 2 and item.isalpha():
+            return None
+    return try_lonely_unit_id(inpt, save)
+
+
+get_nesw_single = get_with_label("st_NESW", try_literals(is_st_NESW))
 
 
 def space_join(stream: Iter[str]) -> str:
@@ -565,25 +699,29 @@ class FnsOfParser(Fns_Of):
         return None
 
 
+@lru_cache(maxsize=64)
+def make_fns_of_parser(known_cities: Tuple[str, ...] = ()) -> FnsOfParser:
+    """
+    Parsers with the same known cities share one FnsOfParser (and its closures).
+    An entry is only a class and a reference to make_get_city's cached city parser.
+    """
+    get_city = make_get_city(known_cities)
+
+    class __FnsOfParser__(FnsOfParser):
+        @staticmethod
+        def get_city(inpt: In[str], save: Fn[[In[str]], None]) -> Opt[Tuple[str, str]]:
+            return get_city(inpt, save)
+
+    return __FnsOfParser__()
+
+
 class Parser:
     __fns_of__: FnsOfParser
     known_cities: List[str]
 
     def __init__(self, known_cities: Seq[str] = ()):
-        get_city = get_with_label(
-            "city",
-            from_mealy(city_mealy(known_cities=known_cities), normalizers=[syns]),
-        )
-
-        class __FnsOfParser__(FnsOfParser):
-            @staticmethod
-            def get_city(
-                inpt: In[str], save: Fn[[In[str]], None]
-            ) -> Opt[Tuple[str, str]]:
-                return get_city(inpt, save)
-
-        self.__fns_of__ = __FnsOfParser__()
         self.known_cities = [x for x in known_cities]
+        self.__fns_of__ = make_fns_of_parser(tuple(self.known_cities))
 
     @property
     def get_city(self) -> Fn[[In[str], Fn[[In[str]], None]], Opt[Tuple[str, str]]]:
@@ -615,15 +753,12 @@ class Parser:
         st_suffix = get_st_suffix(get_inpt(), save)
         ######################################
         ######################################
-        save(In(list(reversed(list(get_inpt())))))
+        save(get_inpt().reversed_rest())
         house_number: List[str] = []
         st_name: List[str] = []
         hn = get_house_number(get_inpt(), save)
         if hn:
             house_number.append(hn[1])
-        else:
-            # raise ParseError(a, "house_number")
-            pass
         hn = get_house_number(get_inpt(), save)
 
         if hn:
@@ -650,22 +785,25 @@ class Parser:
         yield "st_name", space_join(st_name)
         yield "house_number", space_join(house_number)
 
+    @staticmethod
+    def __strip__(pairs: Iter[Opt[Tuple[str, str]]]) -> Iter[Tuple[str, str]]:
+        "drops the stages that found nothing and strips the rest"
+        for pair in pairs:
+            if pair:
+                label, value = pair
+                value = value.strip()
+                if value:
+                    yield label, value
+
     def tag(self, a: str) -> Iter[Tuple[str, str]]:
-        add = a.upper().split()
-        add.reverse()
-        k = In(add)
-        f: List[In[str]] = [k]
+        f: List[In[str]] = [reversed_input(a)]
 
         def save(d: Any, f: List[In[str]] = f):
             f[0] = d
 
         get_inpt = lambda: f[0]
         yield "orig", a
-        for pair in self.__tag__(get_inpt, save):
-            if pair:
-                pair = (pair[0], pair[1].strip())
-                if pair[1]:
-                    yield pair
+        yield from self.__strip__(self.__tag__(get_inpt, save))
 
     @staticmethod
     def __collect__(d: Dict[str, str]) -> RawAddress:
@@ -698,14 +836,12 @@ class Parser:
         else:
             pass  # TODO raise parse error @ us_state
         yield "city", normalize_whitespace(row.pop().upper())
-        data = list(join(map(lambda s: s.upper().split(), row)))
-        data.reverse()
-        r = [In(data)]
-        for pair in self.__tag__(lambda: r[0], make_mod(r), city_done=True):
-            if pair:
-                pair = (pair[0], pair[1].strip())
-                if pair[1]:
-                    yield pair
+        data: List[str] = []
+        for cell in row:
+            data.extend(cell.upper().split())
+        r = [In(tuple(reversed(data)))]
+        tags = self.__tag__(lambda: r[0], make_mod(r), city_done=True)
+        yield from self.__strip__(tags)
 
     def __call__(self, s: str) -> RawAddress:
         try:
@@ -735,23 +871,25 @@ def smart_batch(
     The 'report_error' callback is called on all address strings that cannot be repaired
     (other than 'report_error', all ParseErrors are ignored)
     """
-    errs: List[str] = []
+    errs: Deque[Tuple[ParseError, str]] = deque()
     cities: Set[str] = set([])
-    pre = 0
     for add in adds:
         try:
             a = p(add)
             cities.add(a.city)
-            pre += 1
             yield a
-        except ParseError:
-            errs.append(add)
-    p = Parser(known_cities=p.known_cities + list(cities))
-    fixed = 0
-    for add in errs:
+        except ParseError as e:
+            errs.append((e, add))
+    new_cities = cities - set(p.known_cities)
+    if not new_cities:
+        # the same cities would give the same errors, so don't parse them again
+        for err, add in errs:
+            report_error(err, add)
+        return
+    p = Parser(known_cities=p.known_cities + sorted(new_cities))
+    for _, add in errs:
         try:
             a = p(add)
-            fixed += 1
             yield a
         except ParseError as e:
             report_error(e, add)
@@ -6,8 +6,9 @@ from .__types__ import Iter, Dict, Union, Opt
 
 
 def or_(l: Iter[str]) -> str:
-    ll = [x for x in l if x]
-    # ll : t.List[str] = sorted(l, key = len, reverse=True)
+    # longest first, so 'NE' is tried before 'N' instead of after a failed '\b'
+    # (ties are alphabetical, so patterns built from a set are the same every run)
+    ll = sorted(set(x for x in l if x), key=lambda x: (-len(x), x))
     return r"\s*\b(" + "|".join(ll) + r")\b\s*"
 
 
@@ -17,7 +18,8 @@ def and_(l: Iter[str]) -> str:
 
 
 def normalize_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    # str.split() uses the same whitespace as r"\s+" and strip(), in one C-level pass
+    return " ".join(s.split())
 
 
 def remove(pat: Pattern[str], s: str) -> str:
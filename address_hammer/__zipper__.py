@@ -19,7 +19,8 @@ class GenericInput(Generic[T]):
     data: Seq[T]
 
     def __init__(self, data: Seq[T], state: int = 0):
-        self.data = list(data)
+        # every cursor made by rest/advance shares one immutable tuple
+        self.data = data if isinstance(data, tuple) else tuple(data)
         self.state = state
 
     def copy(self) -> GenericInput[T]:
@@ -32,12 +33,11 @@ class GenericInput(Generic[T]):
         return InputIter(self)
 
     def as_list(self) -> List[T]:
-        return [x for x in self.as_iter()]
+        return list(self.data[self.state :])
 
     def item(self) -> T:
-        # print(self.as_str())
-        if self.state + 1 > len(self.data):
-            raise EndOfInputError()  # (self.as_str(), "getting item")
+        if self.state >= len(self.data):
+            raise EndOfInputError()
         return self.data[self.state]
 
     def orig_str(self) -> str:
@@ -63,6 +63,10 @@ class GenericInput(Generic[T]):
     def rest(self) -> GenericInput[T]:
         return GenericInput(self.data, self.state + 1)
 
+    def reversed_rest(self) -> GenericInput[T]:
+        "The unconsumed items in reverse order, without stepping through them one at a time"
+        return GenericInput(self.data[self.state :][::-1])
+
     def view(self) -> Tuple[T, GenericInput[T]]:
         return (self.item(), self.rest())
 
@@ -71,7 +75,7 @@ class GenericInput(Generic[T]):
         return GenericInput(s.upper().split())
 
     def empty(self) -> bool:
-        return self.state + 1 > len(self.data)
+        return self.state >= len(self.data)
 
     def __len__(self) -> int:
         return len(self.data) - self.state + 1
@@ -84,19 +88,22 @@ class GenericInput(Generic[T]):
 
 
 class InputIter(Generic[T]):
-    __slots__ = ["i"]
-    i: GenericInput[T]
+    # a plain index into the cursor's shared data, so stepping allocates nothing
+    __slots__ = ["data", "idx"]
+    data: Seq[T]
+    idx: int
 
     def __init__(self, i: GenericInput[T]):
-        self.i = i
+        self.data = i.data
+        self.idx = i.state
 
     def __iter__(self) -> InputIter[T]:
-        return InputIter(self.i)
+        return InputIter(GenericInput(self.data, self.idx))
 
     def __next__(self) -> T:
         try:
-            item = self.i.item()
-        except EndOfInputError:
+            item = self.data[self.idx]
+        except IndexError:
             raise StopIteration
-        self.i = self.i.rest()
-        return item
\ No newline at end of file
+        self.idx += 1
+        return item
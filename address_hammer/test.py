@@ -1,5 +1,6 @@
 from __future__ import annotations
 import unittest
+from unittest import mock
 from random import shuffle
 import random
 from json import loads, dumps
@@ -20,7 +21,10 @@ from .__parsing__ import (
     to_input_lst,
     get_nesw,
     get_full_hwy,
+    smart_batch,
 )
+from . import __parsing__ as parsing
+from .__data__ import default_cities, state_city_pairs
 from .__zipper__ import EndOfInputError, GenericInput
 from .__fuzzy_string__ import FixTypos
 from .__hammer__ import Hammer
@@ -327,9 +331,6 @@ def parse_benchmak():
     print("EACH: ", int(((stop - start) / n) / 1000))
 
 
-parse_benchmak()
-
-
 def parse_row_benchmak():
 
     exs = [a.as_row() for a in EXAMPLE_ADDRESSES]
@@ -344,9 +345,6 @@ def parse_row_benchmak():
     print("EACH ROW: ", int(((stop - start) / n) / 1000))
 
 
-parse_row_benchmak()
-
-
 def hammer_bench():
 
     exs = list(join(map(lambda _: EXAMPLE_ADDRESSES, range(1000))))
@@ -648,6 +646,54 @@ class TestParser(unittest.TestCase):
             with self.assertRaises((ParseError, EndOfInputError)):
                 p(s)
 
+    def test_smart_batch(self):
+        errs: List[str] = []
+        report_error: Fn[[ParseError, str], None] = lambda e, s: errs.append(s)
+        bad = "1 Oak Asdfgh NY"
+        p = Parser(known_cities=["Zxcvbn"])
+
+        # no new cities: the errors are reported without building a second Parser
+        with mock.patch.object(parsing, "Parser", wraps=Parser) as make_parser:
+            adds = [bad, "123 Qwerty Zxcvbn NY"]
+            parsed = list(smart_batch(p, adds, report_error=report_error))
+        make_parser.assert_not_called()
+        self.assertEqual(["Zxcvbn"], [a.city for a in parsed])
+        self.assertEqual([bad], errs)
+
+        # new cities: one retry Parser with the known cities plus the sorted new ones
+        errs.clear()
+        with mock.patch.object(parsing, "Parser", wraps=Parser) as make_parser:
+            adds = [bad, "1 Main St Detroit MI", "2 Elm St Boston MA"]
+            parsed = list(smart_batch(p, adds, report_error=report_error))
+        make_parser.assert_called_once_with(
+            known_cities=["Zxcvbn", "BOSTON", "DETROIT"]
+        )
+        self.assertEqual(["DETROIT", "BOSTON"], [a.city for a in parsed])
+        self.assertEqual([bad], errs)
+
+    def test_city_mealy(self):
+        def baseline_city_mealy(known_cities: List[str]) -> Dict[Any, str]:
+            # city_mealy before the default mealy was shared: everything in one dict
+            d: Dict[str, Any] = {}
+            for city in [*known_cities, *default_cities]:
+                d[city] = [city.upper().split()]
+            for _, city in state_city_pairs:
+                city = city.upper()
+                d[city] = [city.split()]
+            parsing.reverse_dict(d)
+            return parsing.to_mealy(d)
+
+        for known_cities in [
+            ["detroit"],  # differs from a default only by case, so the default wins
+            ["Zxcvbn", "Detroit", "DETROIT"],
+            ["CLEAR LAKE", "lake clear", "Grand Rapids"],
+        ]:
+            m = parsing.city_mealy(known_cities)
+            expected = baseline_city_mealy(known_cities)
+            self.assertEqual(expected, dict(m))
+            self.assertEqual(len(expected), len(m))
+        self.assertEqual("DETROIT", Parser(["detroit"])("1 Main St Detroit MI").city)
+
 
 class TestHammer(unittest.TestCase):
     def test_checksum(self):  # passes, but slow
@@ -734,3 +780,9 @@ class TestSheet(unittest.TestCase):
         sheet = Sheet("B:I", a + a)
 
         self.assertEqual(strip(a), strip(sheet.merge_duplicates()))
+
+
+if __name__ == "__main__":
+    parse_benchmak()
+    parse_row_benchmak()
+    unittest.main()